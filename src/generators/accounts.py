@@ -7,13 +7,14 @@ this module contains only the distribution logic.
 """
 
 import random
+import sys
 from dataclasses import dataclass
 from typing import List
 
 from faker import Faker
 
 
-@dataclass
+@dataclass(slots=True)
 class Account:
     """
     Represents a company account.
@@ -104,21 +105,36 @@ class AccountGenerator:
             profile = B2BSaaSProfile()
         self.profile = profile
 
+        # Snapshot the profile's word-list properties once — each access
+        # rebuilds its list — and intern the industry pool so every account
+        # sharing an industry references the same str object.
+        self._name_strategies = tuple(profile.company_name_strategies)
+        self._name_prefixes = tuple(profile.name_prefixes)
+        self._name_suffixes = tuple(profile.name_suffixes)
+        self._industries = tuple(sys.intern(i) for i in profile.industries)
+        self._website_tlds = tuple(profile.website_tlds)
+        self._description_templates = tuple(profile.description_templates)
+        self._founded_year_range = profile.founded_year_range
+        self._revenue_per_employee_range = profile.revenue_per_employee_range
+        self._emp_tiers = [(lo, hi) for lo, hi, _ in profile.employee_tiers]
+        self._emp_weights = [w for _, _, w in profile.employee_tiers]
+        self._states = tuple(self.STATE_TO_REGION.keys())
+
     def _generate_company_name(self) -> str:
         """
         Generate a realistic company name using profile-provided word lists.
 
         Uses strategies defined by the profile (prefix_suffix, prefix_word, faker).
         """
-        strategy = random.choice(self.profile.company_name_strategies)
+        strategy = random.choice(self._name_strategies)
 
         if strategy == "prefix_suffix":
-            prefix = random.choice(self.profile.name_prefixes)
-            suffix = random.choice(self.profile.name_suffixes)
+            prefix = random.choice(self._name_prefixes)
+            suffix = random.choice(self._name_suffixes)
             return f"{prefix}{suffix}"
 
         elif strategy == "prefix_word":
-            prefix = random.choice(self.profile.name_prefixes)
+            prefix = random.choice(self._name_prefixes)
             word = self.faker.word().capitalize()
             return f"{prefix}{word}"
 
@@ -130,13 +146,7 @@ class AccountGenerator:
 
     def _generate_employee_count(self) -> int:
         """Generate a realistic employee count using profile-weighted tiers."""
-        tiers = []
-        weights = []
-        for min_emp, max_emp, weight in self.profile.employee_tiers:
-            tiers.append((min_emp, max_emp))
-            weights.append(weight)
-
-        selected_tier = random.choices(tiers, weights=weights)[0]
+        selected_tier = random.choices(self._emp_tiers, weights=self._emp_weights)[0]
         return random.randint(selected_tier[0], selected_tier[1])
 
     def _generate_annual_revenue(self, employee_count: int) -> int:
@@ -146,10 +156,7 @@ class AccountGenerator:
         Revenue is correlated with employee count using a revenue-per-employee
         multiplier from the profile.
         """
-        revenue_per_employee = random.randint(
-            self.profile.revenue_per_employee_range[0],
-            self.profile.revenue_per_employee_range[1]
-        )
+        revenue_per_employee = random.randint(*self._revenue_per_employee_range)
 
         revenue = employee_count * revenue_per_employee
         revenue = max(100000, min(revenue, 50000000))
@@ -159,17 +166,17 @@ class AccountGenerator:
         """Generate a website URL based on company name."""
         clean_name = "".join(c for c in company_name if c.isalnum())
         clean_name = clean_name.lower()
-        tld = random.choice(self.profile.website_tlds)
+        tld = random.choice(self._website_tlds)
         return f"https://www.{clean_name}{tld}"
 
     def _generate_description(self, industry: str) -> str:
         """Generate a brief company description based on industry."""
-        template = random.choice(self.profile.description_templates)
+        template = random.choice(self._description_templates)
         return template.format(industry=industry.lower())
 
     def _generate_address(self) -> dict:
         """Generate a realistic US address with state-derived region."""
-        state = random.choice(list(self.STATE_TO_REGION.keys()))
+        state = random.choice(self._states)
         return {
             "street_address": self.faker.street_address(),
             "city": self.faker.city(),
@@ -190,11 +197,11 @@ class AccountGenerator:
             An Account dataclass instance with all fields populated.
         """
         company_name = self._generate_company_name()
-        industry = random.choice(self.profile.industries)
+        industry = random.choice(self._industries)
         employee_count = self._generate_employee_count()
         annual_revenue = self._generate_annual_revenue(employee_count)
         address = self._generate_address()
-        yr_min, yr_max = self.profile.founded_year_range
+        yr_min, yr_max = self._founded_year_range
         founded_year = random.randint(yr_min, yr_max)
         website = self._generate_website(company_name)
         description = self._generate_description(industry)
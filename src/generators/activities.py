@@ -6,14 +6,16 @@ Each activity is linked to an account and contact, and optionally to a deal.
 Business-specific constants come from the profile.
 """
 
-import csv
 import datetime
 import random
 from dataclasses import dataclass
 from typing import Dict, List
 
+import numpy as np
+import pandas as pd
 
-@dataclass
+
+@dataclass(slots=True)
 class Activity:
     """
     Represents a CRM activity/touchpoint.
@@ -89,6 +91,9 @@ class ActivityGenerator:
         deals_csv_path: str,
         seed: int = None,
         profile=None,
+        accounts: List[dict] = None,
+        contacts: List[dict] = None,
+        deals: List[dict] = None,
     ):
         if seed is not None:
             random.seed(seed)
@@ -98,35 +103,52 @@ class ActivityGenerator:
             profile = B2BSaaSProfile()
         self.profile = profile
 
-        # Load source data
-        self.accounts = self._load_accounts(accounts_csv_path)
-        self.contacts = self._load_contacts(contacts_csv_path)
-        self.deals = self._load_deals(deals_csv_path)
+        # Load source data; pre-loaded records (from the "generate all"
+        # flow) skip the CSV re-parse of data already in memory.
+        self.accounts = (
+            accounts if accounts is not None
+            else self._load_accounts(accounts_csv_path)
+        )
+        self.contacts = (
+            contacts if contacts is not None
+            else self._load_contacts(contacts_csv_path)
+        )
+        self.deals = (
+            deals if deals is not None
+            else self._load_deals(deals_csv_path)
+        )
 
         # Build contacts-by-account and contacts-by-id lookups
         self.contacts_by_account: Dict[int, List[dict]] = {}
         self.contacts_by_id: Dict[int, dict] = {}
         for c in self.contacts:
-            aid = int(c["account_id"])
+            aid = c["account_id"]
             self.contacts_by_account.setdefault(aid, []).append(c)
-            self.contacts_by_id[int(c["contact_id"])] = c
+            self.contacts_by_id[c["contact_id"]] = c
 
-        # Build deals-by-account lookup
+        # Build deals-by-account lookup plus the deal metadata maps the
+        # summary stats need, all in the same pass.
         self.deals_by_account: Dict[int, List[dict]] = {}
+        self.deal_status_map: Dict[str, str] = {}
+        self.deal_segment_map: Dict[str, str] = {}
         for d in self.deals:
-            aid = int(d["account_id"])
-            self.deals_by_account.setdefault(aid, []).append(d)
-
-        # Segment classification from employee_count
-        self.account_segments: Dict[int, str] = {}
-        for a in self.accounts:
-            aid = int(a["id"])
-            self.account_segments[aid] = self.profile.classify_segment(
-                int(a["employee_count"])
-            )
+            self.deals_by_account.setdefault(d["account_id"], []).append(d)
+            did = d["deal_id"]
+            self.deal_status_map[did] = d["deal_status"]
+            self.deal_segment_map[did] = d["segment"]
+
+        # Segment classification from employee_count — thresholds are
+        # profile-wide, so digitize the whole column in one numpy call.
+        emp = np.array([a["employee_count"] for a in self.accounts])
+        smb_max, mid_max = self.profile.segment_thresholds
+        seg_idx = np.digitize(emp, (smb_max, mid_max + 1))
+        labels = ("SMB", "Mid-Market", "Enterprise")
+        self.account_segments: Dict[int, str] = {
+            a["id"]: labels[i] for a, i in zip(self.accounts, seg_idx)
+        }
 
         # Quick-lookup sets
-        self.all_account_ids = [int(a["id"]) for a in self.accounts]
+        self.all_account_ids = [a["id"] for a in self.accounts]
         self.accounts_with_deals = set(self.deals_by_account.keys())
         self.accounts_without_deals = (
             set(self.all_account_ids) - self.accounts_with_deals
@@ -136,38 +158,54 @@ class ActivityGenerator:
     #  CSV loaders                                                        #
     # ------------------------------------------------------------------ #
 
+    # Columns are parsed in one C-level pass with ids typed at load;
+    # read_csv(usecols=list) raises a ValueError naming missing columns.
+    # keep_default_na=False preserves empty strings (close_date/deal_owner)
+    # instead of turning them into NaN.
+
     @staticmethod
     def _load_accounts(path: str) -> List[dict]:
-        with open(path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            required = {"id", "employee_count"}
-            if not required.issubset(set(reader.fieldnames or [])):
-                missing = required - set(reader.fieldnames or [])
-                raise ValueError(f"Accounts CSV missing columns: {missing}")
-            return list(reader)
+        df = pd.read_csv(
+            path,
+            usecols=["id", "employee_count"],
+            dtype={"id": int, "employee_count": int},
+        )
+        return df.to_dict("records")
 
     @staticmethod
     def _load_contacts(path: str) -> List[dict]:
-        with open(path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            required = {"contact_id", "account_id", "contact_owner"}
-            if not required.issubset(set(reader.fieldnames or [])):
-                missing = required - set(reader.fieldnames or [])
-                raise ValueError(f"Contacts CSV missing columns: {missing}")
-            return list(reader)
+        # first_name is optional — _generate_email_notes falls back to
+        # "there" when it is absent — so the column filter is a callable
+        # and only the required trio is checked explicitly.
+        wanted = {"contact_id", "first_name", "account_id", "contact_owner"}
+        df = pd.read_csv(
+            path,
+            usecols=lambda c: c in wanted,
+            dtype={"contact_id": int, "account_id": int},
+            keep_default_na=False,
+        )
+        required = {"contact_id", "account_id", "contact_owner"}
+        missing = required - set(df.columns)
+        if missing:
+            raise ValueError(f"Contacts CSV missing columns: {missing}")
+        return df.to_dict("records")
 
     @staticmethod
     def _load_deals(path: str) -> List[dict]:
-        with open(path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            required = {
+        df = pd.read_csv(
+            path,
+            usecols=[
                 "deal_id", "account_id", "contact_id", "deal_status",
                 "deal_owner", "created_date", "close_date", "segment",
-            }
-            if not required.issubset(set(reader.fieldnames or [])):
-                missing = required - set(reader.fieldnames or [])
-                raise ValueError(f"Deals CSV missing columns: {missing}")
-            return list(reader)
+            ],
+            dtype={
+                "deal_id": str, "account_id": int, "contact_id": int,
+                "deal_status": str, "deal_owner": str,
+                "created_date": str, "close_date": str, "segment": str,
+            },
+            keep_default_na=False,
+        )
+        return df.to_dict("records")
 
     # ------------------------------------------------------------------ #
     #  Classifiers / pickers                                              #
@@ -383,9 +421,9 @@ class ActivityGenerator:
         # ============================================================== #
 
         for deal in self.deals:
-            deal_id = int(deal["deal_id"])
-            aid = int(deal["account_id"])
-            cid = int(deal["contact_id"])
+            deal_id = deal["deal_id"]
+            aid = deal["account_id"]
+            cid = deal["contact_id"]
             status = deal["deal_status"]
             segment = deal.get("segment", "SMB")
             created = datetime.date.fromisoformat(deal["created_date"])
@@ -434,7 +472,7 @@ class ActivityGenerator:
                 # 70% primary contact, 30% another contact
                 if account_contacts and random.random() < 0.30:
                     contact = random.choice(account_contacts)
-                    contact_id = int(contact["contact_id"])
+                    contact_id = contact["contact_id"]
                 else:
                     contact_id = cid
 
@@ -450,7 +488,7 @@ class ActivityGenerator:
                     activity_date=act_date.isoformat(),
                     account_id=aid,
                     contact_id=contact_id,
-                    deal_id=str(deal_id),
+                    deal_id=deal_id,
                     completed=self._pick_completed(act_date),
                     duration_minutes=duration,
                     notes="",
@@ -480,7 +518,7 @@ class ActivityGenerator:
 
             for _ in range(non_deal_count):
                 contact = random.choice(account_contacts)
-                contact_id = int(contact["contact_id"])
+                contact_id = contact["contact_id"]
                 owner = contact.get("contact_owner", fallback_owner)
 
                 activity_type = self._pick_activity_type_general()
@@ -530,7 +568,7 @@ class ActivityGenerator:
 
             for _ in range(act_count):
                 contact = random.choice(account_contacts)
-                contact_id = int(contact["contact_id"])
+                contact_id = contact["contact_id"]
                 owner = contact.get(
                     "contact_owner", random.choice(self.profile.sales_reps)
                 )
@@ -6,15 +6,23 @@ Each contact is linked to an existing account via account_id.
 Business-specific constants come from the profile.
 """
 
-import csv
 import random
+import sys
 from dataclasses import dataclass
 from typing import Dict, List, Set
 
-from faker import Faker
+import pandas as pd
 
+from faker.providers.person.en_US import Provider as _PersonProvider
 
-@dataclass
+# Snapshot Faker's en_US name pools once at import time. Sampling from plain
+# tuples with random.choice gives the same names without paying Faker's
+# provider dispatch on every call.
+_FIRST_NAMES = tuple(_PersonProvider.first_names)
+_LAST_NAMES = tuple(_PersonProvider.last_names)
+
+
+@dataclass(slots=True)
 class Contact:
     """
     Represents a contact person at a company.
@@ -53,7 +61,13 @@ class ContactGenerator:
         contacts = generator.generate()
     """
 
-    def __init__(self, accounts_csv_path: str, seed: int = None, profile=None):
+    def __init__(
+        self,
+        accounts_csv_path: str,
+        seed: int = None,
+        profile=None,
+        accounts: List[dict] = None,
+    ):
         """
         Initialize the contact generator.
 
@@ -61,12 +75,13 @@ class ContactGenerator:
             accounts_csv_path: Path to the accounts CSV file to read.
             seed: Optional random seed for reproducible data generation.
             profile: A BaseProfile instance. Defaults to B2BSaaSProfile.
+            accounts: Optional pre-loaded account records. When given, the
+                CSV file is not read — used by the "generate all" flow to
+                avoid re-parsing data that is already in memory.
         """
         self.accounts_csv_path = accounts_csv_path
-        self.faker = Faker()
 
         if seed is not None:
-            Faker.seed(seed)
             random.seed(seed)
 
         if profile is None:
@@ -74,21 +89,30 @@ class ContactGenerator:
             profile = B2BSaaSProfile()
         self.profile = profile
 
+        # Intern the repeated string pools once so every contact sharing a
+        # department/title/owner references the same str object. random.choice
+        # hands out references, so interning the pools interns the dataset.
+        dept_weights = profile.department_weights
+        self._departments = [sys.intern(d) for d in dept_weights]
+        self._department_weights = list(dept_weights.values())
+        self._titles_by_department = {
+            sys.intern(dept): [sys.intern(t) for t in titles]
+            for dept, titles in profile.title_by_department.items()
+        }
+        self._sales_reps = [sys.intern(r) for r in profile.sales_reps]
+
         self._used_emails: Dict[str, Set[str]] = {}
-        self.accounts = self._load_accounts()
+        self.accounts = accounts if accounts is not None else self._load_accounts()
 
     def _load_accounts(self) -> List[dict]:
-        """Load accounts from the CSV file."""
+        """Load accounts from the CSV file with ids typed at parse time."""
         try:
-            with open(self.accounts_csv_path, "r", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                required_columns = {"id", "company_name", "website"}
-                if not required_columns.issubset(set(reader.fieldnames or [])):
-                    missing = required_columns - set(reader.fieldnames or [])
-                    raise ValueError(
-                        f"Accounts CSV is missing required columns: {missing}"
-                    )
-                return list(reader)
+            df = pd.read_csv(
+                self.accounts_csv_path,
+                usecols=["id", "company_name", "website"],
+                dtype={"id": int, "company_name": str, "website": str},
+            )
+            return df.to_dict("records")
         except FileNotFoundError:
             raise FileNotFoundError(
                 f"Accounts file not found: {self.accounts_csv_path}\n"
@@ -106,7 +130,7 @@ class ContactGenerator:
 
     def _generate_name(self) -> tuple:
         """Generate a realistic first and last name."""
-        return self.faker.first_name(), self.faker.last_name()
+        return random.choice(_FIRST_NAMES), random.choice(_LAST_NAMES)
 
     def _generate_email(self, first_name: str, last_name: str, domain: str) -> str:
         """Generate a unique work email in first.last@domain format."""
@@ -135,11 +159,10 @@ class ContactGenerator:
 
     def _generate_title_and_department(self) -> tuple:
         """Pick a department (weighted) then a random title within it."""
-        departments = list(self.profile.department_weights.keys())
-        weights = list(self.profile.department_weights.values())
-
-        department = random.choices(departments, weights=weights, k=1)[0]
-        title = random.choice(self.profile.title_by_department[department])
+        department = random.choices(
+            self._departments, weights=self._department_weights, k=1
+        )[0]
+        title = random.choice(self._titles_by_department[department])
 
         return title, department
 
@@ -155,22 +178,24 @@ class ContactGenerator:
         Iterates over every account, creates a weighted-random number of
         contacts per account, and assigns globally sequential contact IDs.
         """
-        contacts = []
+        # Draw the per-account counts up front so the output list can be
+        # preallocated instead of growing through repeated appends.
+        counts = [self._generate_contact_count() for _ in self.accounts]
+        contacts = [None] * sum(counts)
         contact_id = 1
 
-        for account in self.accounts:
-            account_id = int(account["id"])
+        for account, count in zip(self.accounts, counts):
+            account_id = account["id"]
             domain = self._extract_email_domain(account["website"])
-            count = self._generate_contact_count()
 
             for _ in range(count):
                 first_name, last_name = self._generate_name()
                 email = self._generate_email(first_name, last_name, domain)
                 phone = self._generate_phone()
                 title, department = self._generate_title_and_department()
-                contact_owner = random.choice(self.profile.sales_reps)
+                contact_owner = random.choice(self._sales_reps)
 
-                contacts.append(Contact(
+                contacts[contact_id - 1] = Contact(
                     contact_id=contact_id,
                     first_name=first_name,
                     last_name=last_name,
@@ -180,8 +205,56 @@ class ContactGenerator:
                     department=department,
                     account_id=account_id,
                     contact_owner=contact_owner,
-                ))
+                )
 
                 contact_id += 1
 
         return contacts
+
+    def generate_parquet(self, out_path: str) -> int:
+        """
+        Generate contacts and write them directly to a Parquet file.
+
+        Columnar output with dictionary encoding for the highly repetitive
+        categorical columns (department, contact_owner, title), which makes
+        files far smaller and faster to load than CSV for downstream
+        consumers. Requires the optional `pyarrow` dependency.
+
+        Args:
+            out_path: Path where the .parquet file should be written.
+
+        Returns:
+            The number of contacts written.
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError(
+                "Parquet export requires pyarrow. "
+                "Install it with: pip install pyarrow"
+            )
+
+        contacts = self.generate()
+        table = pa.table({
+            "contact_id": pa.array(
+                [c.contact_id for c in contacts], type=pa.int64()
+            ),
+            "first_name": [c.first_name for c in contacts],
+            "last_name": [c.last_name for c in contacts],
+            "email": [c.email for c in contacts],
+            "phone": [c.phone for c in contacts],
+            "title": [c.title for c in contacts],
+            "department": [c.department for c in contacts],
+            "account_id": pa.array(
+                [c.account_id for c in contacts], type=pa.int64()
+            ),
+            "contact_owner": [c.contact_owner for c in contacts],
+        })
+        pq.write_table(
+            table,
+            out_path,
+            compression="snappy",
+            use_dictionary=["department", "contact_owner", "title"],
+        )
+        return len(contacts)
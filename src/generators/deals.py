@@ -6,14 +6,58 @@ Each deal is linked to an existing account and contact, with profile-driven
 pipelines, outcome rates, stage progressions, and date relationships.
 """
 
-import csv
+import bisect
 import datetime
+import itertools
 import random
-from dataclasses import dataclass, field
-from typing import Dict, List
+import string
+import sys
 
+import numpy as np
+import pandas as pd
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import partial
+from typing import Dict, List, Tuple
 
-@dataclass
+
+def _build_cdf(weights: Dict[str, int]) -> Tuple[tuple, list, float]:
+    """Precompute (keys, cumulative_weights, total) for bisect sampling."""
+    keys = tuple(weights.keys())
+    cum = list(itertools.accumulate(weights.values()))
+    return keys, cum, cum[-1]
+
+
+_STATUS_BY_STAGE = {"Closed Won": "Won", "Closed Lost": "Lost"}
+
+
+def _derive_status(stage: str) -> str:
+    """Derive deal_status from the stage name."""
+    return _STATUS_BY_STAGE.get(stage, "Open")
+
+
+def _random_date(
+    rand: random.Random, start: datetime.date, end: datetime.date
+) -> datetime.date:
+    """Draw a random date in [start, end] from the given Random."""
+    if start >= end:
+        return start
+    return start + datetime.timedelta(days=rand.randint(0, (end - start).days))
+
+
+# Duplicate-name suffixes: "" for the first occurrence of a base name,
+# then a..z, aa..zz — indexing a table instead of chr/ord arithmetic,
+# and well past 26 collisions per base.
+_DUP_SUFFIXES = (
+    ("",)
+    + tuple(string.ascii_lowercase)
+    + tuple(a + b for a in string.ascii_lowercase for b in string.ascii_lowercase)
+)
+
+
+# slots=True keeps per-instance memory down and speeds up construction
+# and attribute access — generation can produce tens of thousands of these.
+@dataclass(slots=True)
 class Deal:
     """
     Represents a CRM deal/opportunity.
@@ -73,86 +117,151 @@ class DealGenerator:
         contacts_csv_path: str,
         seed: int = None,
         profile=None,
+        accounts: List[dict] = None,
+        contacts: List[dict] = None,
     ):
-        if seed is not None:
-            random.seed(seed)
+        # A dedicated Random instance avoids the module-global indirection
+        # on every draw and keeps seeding isolated to this generator.
+        self._rand = random.Random(seed)
+        self._rng = np.random.default_rng(seed)
 
         if profile is None:
             from profiles.b2b_saas import B2BSaaSProfile
             profile = B2BSaaSProfile()
         self.profile = profile
 
-        self.accounts = self._load_accounts(accounts_csv_path)
-        self.contacts = self._load_contacts(contacts_csv_path)
+        # Pre-loaded records (from the "generate all" flow) skip the CSV
+        # re-parse of data that is already in memory.
+        self.accounts = (
+            accounts if accounts is not None
+            else self._load_accounts(accounts_csv_path)
+        )
+        self.contacts = (
+            contacts if contacts is not None
+            else self._load_contacts(contacts_csv_path)
+        )
 
-        self.contacts_by_account: Dict[int, List[dict]] = {}
+        contacts_by_account: Dict[int, List[dict]] = defaultdict(list)
         for c in self.contacts:
-            aid = int(c["account_id"])
-            self.contacts_by_account.setdefault(aid, []).append(c)
-
-        self._assigned_contacts: Dict[int, set] = {}
-
-        self.account_segments: Dict[int, str] = {}
-        self.account_names: Dict[int, str] = {}
-        for a in self.accounts:
-            aid = int(a["id"])
-            self.account_segments[aid] = self.profile.classify_segment(
-                int(a["employee_count"])
-            )
-            self.account_names[aid] = a["company_name"]
+            contacts_by_account[c["account_id"]].append(c)
+        # Freeze back to a plain dict so later membership tests and lookups
+        # can never insert an empty group for an unknown account.
+        self.contacts_by_account: Dict[int, List[dict]] = dict(contacts_by_account)
+
+        # Shuffle each account's contacts once so _pick_contact can hand
+        # them out through a cursor in O(1), instead of re-filtering the
+        # candidate list against an assigned-id set on every pick.
+        shuffle = self._rand.shuffle
+        for clist in self.contacts_by_account.values():
+            shuffle(clist)
+        self._contact_cursor: Dict[int, int] = {}
+
+        # Cumulative-weight tables so the hot per-deal pickers can bisect
+        # instead of rebuilding key/weight lists for self._rand.choices.
+        self._outcome_cdf = {
+            p: _build_cdf(rates) for p, rates in profile.outcome_rates.items()
+        }
+        self._loss_default_cdf = _build_cdf(profile.loss_reasons_default)
+        self._loss_enterprise_cdf = _build_cdf(profile.loss_reasons_enterprise)
+        self._active_stage_cdf = {
+            p: _build_cdf(weights)
+            for p, weights in profile.active_stage_weights.items()
+        }
+
+        counts, weights = profile.nb_deal_count_weights
+        self._nb_count_cdf = _build_cdf(dict(zip(counts, weights)))
+
+        # _cycle_days and _generate_amount run per deal; cache the profile
+        # range properties once, since each access rebuilds its dict/tuple.
+        self._nb_cycle_days = dict(profile.nb_cycle_days)
+        self._renewal_cycle_days = profile.renewal_cycle_days
+        self._expansion_cycle_days = profile.expansion_cycle_days
+        self._acv_ranges = dict(profile.acv_ranges)
+        self._renewal_amount_factor = profile.renewal_amount_factor
+        self._expansion_amount_factor = profile.expansion_amount_factor
+        stw = profile.subscription_type_weights
+        self._sub_type_cdf = _build_cdf(stw) if stw else None
+
+        # Re-roll tables for follow-up deals forced out of "Open" by the
+        # active-window rule.
+        self._renewal_reroll_cdf = _build_cdf({"Won": 85, "Lost": 15})
+        self._expansion_reroll_cdf = _build_cdf({"Won": 60, "Lost": 40})
+
+        # Intern the strings that repeat across every deal (owners, pipeline
+        # names, segment labels) so all deals share single str objects, and
+        # cache the pipeline names to avoid re-evaluating profile properties
+        # in the hot paths.
+        self._sales_reps = tuple(sys.intern(r) for r in profile.sales_reps)
+        self._primary_pipeline = sys.intern(profile.primary_pipeline_name)
+        self._renewal_pipeline = sys.intern(profile.renewal_pipeline_name)
+        self._expansion_pipeline = sys.intern(profile.expansion_pipeline_name)
+
+        # Segmentation is threshold-based, so digitize the whole
+        # employee_count column in one shot instead of classifying
+        # account-by-account.
+        emp = np.array([a["employee_count"] for a in self.accounts])
+        smb_max, mid_max = profile.segment_thresholds
+        seg_idx = np.digitize(emp, (smb_max, mid_max + 1))
+        labels = tuple(sys.intern(x) for x in ("SMB", "Mid-Market", "Enterprise"))
+        self.account_segments: Dict[int, str] = {
+            a["id"]: labels[i] for a, i in zip(self.accounts, seg_idx)
+        }
+        self.account_names: Dict[int, str] = {
+            a["id"]: a["company_name"] for a in self.accounts
+        }
+        # The id list never changes after load; build it once for
+        # _select_accounts_with_deals() and generate().
+        self._all_account_ids = [a["id"] for a in self.accounts]
+
+        # Every generated date falls inside the configured range, so render
+        # each day's ISO string once and serve isoformat() calls from a
+        # lookup table indexed by ordinal.
+        self._iso_base = self.DATE_RANGE_START.toordinal()
+        self._iso_table = tuple(
+            datetime.date.fromordinal(o).isoformat()
+            for o in range(self._iso_base, self.DATE_RANGE_END.toordinal() + 1)
+        )
 
     # ------------------------------------------------------------------ #
     #  CSV loaders                                                        #
     # ------------------------------------------------------------------ #
 
+    # No explicit column validation here: read_csv(usecols=...) already
+    # raises a ValueError naming any missing columns.
+
     @staticmethod
     def _load_accounts(path: str) -> List[dict]:
-        with open(path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            required = {"id", "company_name", "employee_count"}
-            if not required.issubset(set(reader.fieldnames or [])):
-                missing = required - set(reader.fieldnames or [])
-                raise ValueError(f"Accounts CSV missing columns: {missing}")
-            return list(reader)
+        df = pd.read_csv(
+            path,
+            usecols=["company_name", "employee_count", "id"],
+            dtype={"id": int, "company_name": str, "employee_count": int},
+        )
+        return df.to_dict("records")
 
     @staticmethod
     def _load_contacts(path: str) -> List[dict]:
-        with open(path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            required = {"contact_id", "account_id"}
-            if not required.issubset(set(reader.fieldnames or [])):
-                missing = required - set(reader.fieldnames or [])
-                raise ValueError(f"Contacts CSV missing columns: {missing}")
-            return list(reader)
+        df = pd.read_csv(
+            path,
+            usecols=["account_id", "contact_id"],
+            dtype={"contact_id": int, "account_id": int},
+        )
+        return df.to_dict("records")
 
     # ------------------------------------------------------------------ #
     #  Classifiers / pickers                                              #
     # ------------------------------------------------------------------ #
 
-    @staticmethod
-    def _derive_status(stage: str) -> str:
-        """Derive deal_status from the stage name."""
-        if stage == "Closed Won":
-            return "Won"
-        elif stage == "Closed Lost":
-            return "Lost"
-        return "Open"
-
     def _pick_outcome(self, pipeline: str) -> str:
-        rates = self.profile.outcome_rates[pipeline]
-        return random.choices(
-            list(rates.keys()), weights=list(rates.values()), k=1
-        )[0]
+        keys, cum, total = self._outcome_cdf[pipeline]
+        return keys[bisect.bisect(cum, self._rand.random() * total)]
 
     def _pick_loss_reason(self, segment: str) -> str:
-        weights = (
-            self.profile.loss_reasons_enterprise
+        keys, cum, total = (
+            self._loss_enterprise_cdf
             if segment == "Enterprise"
-            else self.profile.loss_reasons_default
+            else self._loss_default_cdf
         )
-        return random.choices(
-            list(weights.keys()), weights=list(weights.values()), k=1
-        )[0]
+        return keys[bisect.bisect(cum, self._rand.random() * total)]
 
     def _pick_contact(self, aid: int) -> dict:
         """
@@ -160,18 +269,16 @@ class DealGenerator:
         to any deal at this account. Falls back to random if all assigned.
         """
         candidates = self.contacts_by_account[aid]
-        assigned = self._assigned_contacts.get(aid, set())
-        unassigned = [c for c in candidates if int(c["contact_id"]) not in assigned]
-        contact = random.choice(unassigned) if unassigned else random.choice(candidates)
-        self._assigned_contacts.setdefault(aid, set()).add(int(contact["contact_id"]))
-        return contact
+        i = self._contact_cursor.get(aid, 0)
+        if i < len(candidates):
+            self._contact_cursor[aid] = i + 1
+            return candidates[i]
+        return self._rand.choice(candidates)
 
     def _pick_active_stage(self, pipeline: str) -> str:
         """Pick an open-deal stage using weighted probabilities."""
-        weights = self.profile.active_stage_weights[pipeline]
-        return random.choices(
-            list(weights.keys()), weights=list(weights.values()), k=1
-        )[0]
+        keys, cum, total = self._active_stage_cdf[pipeline]
+        return keys[bisect.bisect(cum, self._rand.random() * total)]
 
     # ------------------------------------------------------------------ #
     #  Amount generation                                                  #
@@ -180,52 +287,50 @@ class DealGenerator:
     def _generate_amount(
         self, pipeline: str, segment: str, original_amount: int = 0
     ) -> int:
-        if pipeline == self.profile.primary_pipeline_name:
-            lo, hi = self.profile.acv_ranges[segment]
-            return round(random.randint(lo, hi) / 500) * 500
-        elif pipeline == self.profile.renewal_pipeline_name:
-            r_lo, r_hi = self.profile.renewal_amount_factor
-            raw = int(original_amount * random.uniform(r_lo, r_hi))
-            return round(raw / 100) * 100
+        # Round-to-nearest stays in the int domain: (x + half) // step * step
+        # avoids the float division and banker's rounding of round(x/step).
+        if pipeline == self._primary_pipeline:
+            lo, hi = self._acv_ranges[segment]
+            return (self._rand.randint(lo, hi) + 250) // 500 * 500
+        elif pipeline == self._renewal_pipeline:
+            r_lo, r_hi = self._renewal_amount_factor
+            raw = int(original_amount * self._rand.uniform(r_lo, r_hi))
+            return (raw + 50) // 100 * 100
         else:  # Expansion / follow-on
-            e_lo, e_hi = self.profile.expansion_amount_factor
-            raw = int(original_amount * random.uniform(e_lo, e_hi))
-            return round(raw / 100) * 100
+            e_lo, e_hi = self._expansion_amount_factor
+            raw = int(original_amount * self._rand.uniform(e_lo, e_hi))
+            return (raw + 50) // 100 * 100
 
     # ------------------------------------------------------------------ #
     #  Date helpers                                                       #
     # ------------------------------------------------------------------ #
 
-    def _random_date(
-        self, start: datetime.date, end: datetime.date
-    ) -> datetime.date:
-        if start >= end:
-            return start
-        return start + datetime.timedelta(
-            days=random.randint(0, (end - start).days)
-        )
+    def _iso(self, d: datetime.date) -> str:
+        """Return d.isoformat() via the precomputed per-day string table."""
+        return self._iso_table[d.toordinal() - self._iso_base]
 
     def _cycle_days(self, pipeline: str, segment: str) -> int:
-        if pipeline == self.profile.primary_pipeline_name:
-            lo, hi = self.profile.nb_cycle_days[segment]
-        elif pipeline == self.profile.renewal_pipeline_name:
-            lo, hi = self.profile.renewal_cycle_days
+        if pipeline == self._primary_pipeline:
+            lo, hi = self._nb_cycle_days[segment]
+        elif pipeline == self._renewal_pipeline:
+            lo, hi = self._renewal_cycle_days
         else:
-            lo, hi = self.profile.expansion_cycle_days
-        return random.randint(lo, hi)
+            lo, hi = self._expansion_cycle_days
+        return self._rand.randint(lo, hi)
 
     # ------------------------------------------------------------------ #
     #  Account / deal-count selection                                     #
     # ------------------------------------------------------------------ #
 
     def _select_accounts_with_deals(self) -> List[int]:
-        all_ids = [int(a["id"]) for a in self.accounts]
+        all_ids = self._all_account_ids
         k = max(1, round(len(all_ids) * self.profile.accounts_with_deals_fraction))
-        return sorted(random.sample(all_ids, k))
+        picked = self._rng.choice(len(all_ids), size=k, replace=False)
+        return sorted(all_ids[i] for i in picked)
 
     def _generate_nb_deal_count(self) -> int:
-        counts, weights = self.profile.nb_deal_count_weights
-        return random.choices(counts, weights=weights, k=1)[0]
+        counts, cum, total = self._nb_count_cdf
+        return counts[bisect.bisect(cum, self._rand.random() * total)]
 
     # ------------------------------------------------------------------ #
     #  Follow-up deal helper (Renewal / Expansion)                        #
@@ -242,67 +347,39 @@ class DealGenerator:
     ) -> None:
         """Generate a single Renewal or Expansion deal and append it."""
         contact = self._pick_contact(aid)
-        cid = int(contact["contact_id"])
-        owner = random.choice(self.profile.sales_reps)
+        cid = contact["contact_id"]
+        owner = self._rand.choice(self._sales_reps)
         amount = self._generate_amount(pipeline, segment, original_amount)
 
         outcome = self._pick_outcome(pipeline)
 
         # Active-window enforcement: old deals can't stay Open
         if outcome == "Open" and created < self.ACTIVE_WINDOW_START:
-            outcome = random.choices(
-                ["Won", "Lost"],
-                weights=[85, 15] if pipeline == self.profile.renewal_pipeline_name else [60, 40],
-                k=1,
-            )[0]
-
-        if outcome == "Open":
-            stage = self._pick_active_stage(pipeline)
-            deals.append(Deal(
-                deal_id=0,
-                deal_name="",
-                account_id=aid,
-                contact_id=cid,
-                pipeline=pipeline,
-                segment=segment,
-                stage=stage,
-                amount=amount,
-                created_date=created.isoformat(),
-                close_date="",
-                deal_status=self._derive_status(stage),
-                deal_owner=owner,
-                loss_reason="",
-            ))
-            return
+            keys, cum, total = (
+                self._renewal_reroll_cdf
+                if pipeline == self._renewal_pipeline
+                else self._expansion_reroll_cdf
+            )
+            outcome = keys[bisect.bisect(cum, self._rand.random() * total)]
 
-        # Won or Lost
-        cycle = self._cycle_days(pipeline, segment)
-        close = created + datetime.timedelta(days=cycle)
+        # Won or Lost deals that would close past the date range stay Open
+        if outcome != "Open":
+            cycle = self._cycle_days(pipeline, segment)
+            close = created + datetime.timedelta(days=cycle)
+            if close > self.DATE_RANGE_END:
+                outcome = "Open"
 
-        if close > self.DATE_RANGE_END:
+        if outcome == "Open":
             stage = self._pick_active_stage(pipeline)
-            deals.append(Deal(
-                deal_id=0,
-                deal_name="",
-                account_id=aid,
-                contact_id=cid,
-                pipeline=pipeline,
-                segment=segment,
-                stage=stage,
-                amount=amount,
-                created_date=created.isoformat(),
-                close_date="",
-                deal_status=self._derive_status(stage),
-                deal_owner=owner,
-                loss_reason="",
-            ))
-            return
-
-        if outcome == "Won":
+            close_date = ""
+            reason = ""
+        elif outcome == "Won":
             stage = "Closed Won"
+            close_date = self._iso(close)
             reason = ""
         else:
             stage = "Closed Lost"
+            close_date = self._iso(close)
             reason = self._pick_loss_reason(segment)
 
         deals.append(Deal(
@@ -314,9 +391,9 @@ class DealGenerator:
             segment=segment,
             stage=stage,
             amount=amount,
-            created_date=created.isoformat(),
-            close_date=close.isoformat(),
-            deal_status=self._derive_status(stage),
+            created_date=self._iso(created),
+            close_date=close_date,
+            deal_status=_derive_status(stage),
             deal_owner=owner,
             loss_reason=reason,
         ))
@@ -344,47 +421,60 @@ class DealGenerator:
 
         # Select a fraction of all accounts for self-serve
         k = max(1, round(len(all_account_ids) * fraction))
-        ss_accounts = random.sample(all_account_ids, min(k, len(all_account_ids)))
+        ss_accounts = [
+            aid
+            for aid in self._rand.sample(all_account_ids, min(k, len(all_account_ids)))
+            if aid in self.contacts_by_account
+        ]
+        n = len(ss_accounts)
+        if n == 0:
+            return
 
-        for aid in ss_accounts:
-            if aid not in self.contacts_by_account:
-                continue
+        # Every draw here is independent per account, so batch them all
+        # through numpy up front instead of paying per-call stdlib RNG
+        # overhead inside the loop.
+        rng = self._rng
+        sub_keys = tuple(sub_split.keys())
+        probs = np.array(list(sub_split.values()), dtype=float)
+        type_idx = rng.choice(len(sub_keys), size=n, p=probs / probs.sum())
+
+        m_lo, m_hi = config["monthly_amount_range"]
+        y_lo, y_hi = config["yearly_amount_range"]
+        is_monthly = np.array([sub_keys[i] == "Monthly" for i in type_idx])
+        amounts = np.where(
+            is_monthly,
+            rng.integers(m_lo, m_hi + 1, size=n),
+            rng.integers(y_lo, y_hi + 1, size=n),
+        )
+        amounts = (amounts + 25) // 50 * 50
+
+        converted = rng.random(n) < conversion_rate
+        total_days = (self.DATE_RANGE_END - self.DATE_RANGE_START).days
+        created_offsets = rng.integers(0, total_days + 1, size=n)
+        cycles = np.where(
+            converted,
+            rng.integers(1, 15, size=n),
+            rng.integers(1, 31, size=n),
+        )
+        plg_draws = rng.random(n) < plg_to_sales_prob
 
+        for i, aid in enumerate(ss_accounts):
             contact = self._pick_contact(aid)
-            cid = int(contact["contact_id"])
-
-            # Determine subscription type
-            sub_type = random.choices(
-                list(sub_split.keys()),
-                weights=list(sub_split.values()),
-                k=1,
-            )[0]
-
-            # Determine amount
-            if sub_type == "Monthly":
-                lo, hi = config["monthly_amount_range"]
-            else:
-                lo, hi = config["yearly_amount_range"]
-            amount = round(random.randint(lo, hi) / 50) * 50
+            cid = contact["contact_id"]
 
-            # Determine outcome: converted or churned
-            converted = random.random() < conversion_rate
-            created = self._random_date(self.DATE_RANGE_START, self.DATE_RANGE_END)
+            created = self.DATE_RANGE_START + datetime.timedelta(
+                days=int(created_offsets[i])
+            )
+            close = created + datetime.timedelta(days=int(cycles[i]))
+            if close > self.DATE_RANGE_END:
+                close = self.DATE_RANGE_END
 
-            if converted:
+            if converted[i]:
                 stage = "Converted"
                 status = "Won"
-                cycle = random.randint(1, 14)
-                close = created + datetime.timedelta(days=cycle)
-                if close > self.DATE_RANGE_END:
-                    close = self.DATE_RANGE_END
             else:
                 stage = "Churned"
                 status = "Lost"
-                cycle = random.randint(1, 30)
-                close = created + datetime.timedelta(days=cycle)
-                if close > self.DATE_RANGE_END:
-                    close = self.DATE_RANGE_END
 
             deals.append(Deal(
                 deal_id=0,
@@ -394,17 +484,17 @@ class DealGenerator:
                 pipeline=pipeline_name,
                 segment="Self-Serve",
                 stage=stage,
-                amount=amount,
-                created_date=created.isoformat(),
-                close_date=close.isoformat(),
+                amount=int(amounts[i]),
+                created_date=self._iso(created),
+                close_date=self._iso(close),
                 deal_status=status,
                 deal_owner="",  # No sales rep for self-serve
                 loss_reason="",
-                subscription_type=sub_type,
+                subscription_type=sub_keys[type_idx[i]],
             ))
 
             # PLG-to-sales: small chance converted self-serve gets a NB deal later
-            if converted and random.random() < plg_to_sales_prob:
+            if converted[i] and plg_draws[i]:
                 plg_to_nb_accounts.add(aid)
 
     # ------------------------------------------------------------------ #
@@ -413,105 +503,113 @@ class DealGenerator:
 
     def generate(self) -> List[Deal]:
         deals: List[Deal] = []
-        won_nb: Dict[int, list] = {}   # account_id -> [{close_date, amount}]
+        won_nb: Dict[int, list] = defaultdict(list)   # account_id -> [{close_date, amount}]
 
         selected = self._select_accounts_with_deals()
-        all_account_ids = [int(a["id"]) for a in self.accounts]
+        all_account_ids = self._all_account_ids
+
+        primary = self._primary_pipeline
+        renewal = self._renewal_pipeline
+        expansion = self._expansion_pipeline
+
+        # Hoist the hot attribute and profile-property lookups out of the
+        # Phase 1 inner loop — each one is a dict lookup (or worse, a
+        # property call that rebuilds a dict) per deal otherwise.
+        pick_contact = self._pick_contact
+        pick_outcome = self._pick_outcome
+        pick_active_stage = self._pick_active_stage
+        pick_loss_reason = self._pick_loss_reason
+        generate_amount = self._generate_amount
+        cycle_days = self._cycle_days
+        random_date = partial(_random_date, self._rand)
+        derive_status = _derive_status
+        choice = self._rand.choice
+        sales_reps = self._sales_reps
+        contacts_by_account = self.contacts_by_account
+        account_segments = self.account_segments
+        deals_append = deals.append
+        date_range_start = self.DATE_RANGE_START
+        date_range_end = self.DATE_RANGE_END
+        active_window_start = self.ACTIVE_WINDOW_START
+        sub_type_cdf = self._sub_type_cdf
+        iso = self._iso
+        rand = self._rand.random
+
+        def append_open_nb(aid, cid, segment, amount, owner, sub_type):
+            """Append an open New Business deal created in the active window."""
+            created = random_date(active_window_start, date_range_end)
+            stage = pick_active_stage(primary)
+            deals_append(Deal(
+                deal_id=0,
+                deal_name="",
+                account_id=aid,
+                contact_id=cid,
+                pipeline=primary,
+                segment=segment,
+                stage=stage,
+                amount=amount,
+                created_date=iso(created),
+                close_date="",
+                deal_status=derive_status(stage),
+                deal_owner=owner,
+                loss_reason="",
+                subscription_type=sub_type,
+            ))
 
-        primary = self.profile.primary_pipeline_name
-        renewal = self.profile.renewal_pipeline_name
-        expansion = self.profile.expansion_pipeline_name
+        # Filter contactless accounts once up front rather than testing and
+        # warning inside the loop.
+        no_contact = [aid for aid in selected if aid not in contacts_by_account]
+        if no_contact:
+            print(
+                f"  [warning] Skipping {len(no_contact)} account(s) "
+                "with no contacts."
+            )
+            selected = [aid for aid in selected if aid in contacts_by_account]
 
         # ---- Phase 1: New Business deals ----
         for aid in selected:
-            if aid not in self.contacts_by_account:
-                print(f"  [warning] Account {aid} has no contacts, skipping.")
-                continue
-
-            segment = self.account_segments[aid]
+            segment = account_segments[aid]
 
-            for _ in range(self._generate_nb_deal_count()):
-                contact = self._pick_contact(aid)
-                cid = int(contact["contact_id"])
-                owner = random.choice(self.profile.sales_reps)
-                amount = self._generate_amount(primary, segment)
+            for _ in itertools.repeat(None, self._generate_nb_deal_count()):
+                contact = pick_contact(aid)
+                cid = contact["contact_id"]
+                owner = choice(sales_reps)
+                amount = generate_amount(primary, segment)
 
                 # Assign subscription_type for sales-assisted SaaS deals
                 sub_type = ""
-                if self.profile.subscription_type_weights:
-                    stw = self.profile.subscription_type_weights
-                    sub_type = random.choices(
-                        list(stw.keys()), weights=list(stw.values()), k=1
-                    )[0]
+                if sub_type_cdf:
+                    keys, cum, total = sub_type_cdf
+                    sub_type = keys[bisect.bisect(cum, rand() * total)]
 
-                outcome = self._pick_outcome(primary)
+                outcome = pick_outcome(primary)
 
                 if outcome == "Open":
-                    created = self._random_date(
-                        self.ACTIVE_WINDOW_START, self.DATE_RANGE_END
-                    )
-                    stage = self._pick_active_stage(primary)
-                    deals.append(Deal(
-                        deal_id=0,
-                        deal_name="",
-                        account_id=aid,
-                        contact_id=cid,
-                        pipeline=primary,
-                        segment=segment,
-                        stage=stage,
-                        amount=amount,
-                        created_date=created.isoformat(),
-                        close_date="",
-                        deal_status=self._derive_status(stage),
-                        deal_owner=owner,
-                        loss_reason="",
-                        subscription_type=sub_type,
-                    ))
+                    append_open_nb(aid, cid, segment, amount, owner, sub_type)
                     continue
 
                 # Won or Lost — pick cycle, compute dates
-                cycle = self._cycle_days(primary, segment)
-                latest_start = self.DATE_RANGE_END - datetime.timedelta(
-                    days=cycle
-                )
-
-                if latest_start <= self.DATE_RANGE_START:
-                    created = self._random_date(
-                        self.ACTIVE_WINDOW_START, self.DATE_RANGE_END
-                    )
-                    stage = self._pick_active_stage(primary)
-                    deals.append(Deal(
-                        deal_id=0,
-                        deal_name="",
-                        account_id=aid,
-                        contact_id=cid,
-                        pipeline=primary,
-                        segment=segment,
-                        stage=stage,
-                        amount=amount,
-                        created_date=created.isoformat(),
-                        close_date="",
-                        deal_status=self._derive_status(stage),
-                        deal_owner=owner,
-                        loss_reason="",
-                        subscription_type=sub_type,
-                    ))
+                cycle = cycle_days(primary, segment)
+                latest_start = date_range_end - datetime.timedelta(days=cycle)
+
+                if latest_start <= date_range_start:
+                    append_open_nb(aid, cid, segment, amount, owner, sub_type)
                     continue
 
-                created = self._random_date(self.DATE_RANGE_START, latest_start)
+                created = random_date(date_range_start, latest_start)
                 close = created + datetime.timedelta(days=cycle)
 
                 if outcome == "Won":
                     stage = "Closed Won"
                     reason = ""
-                    won_nb.setdefault(aid, []).append(
+                    won_nb[aid].append(
                         {"close_date": close, "amount": amount}
                     )
                 else:
                     stage = "Closed Lost"
-                    reason = self._pick_loss_reason(segment)
+                    reason = pick_loss_reason(segment)
 
-                deals.append(Deal(
+                deals_append(Deal(
                     deal_id=0,
                     deal_name="",
                     account_id=aid,
@@ -520,9 +618,9 @@ class DealGenerator:
                     segment=segment,
                     stage=stage,
                     amount=amount,
-                    created_date=created.isoformat(),
-                    close_date=close.isoformat(),
-                    deal_status=self._derive_status(stage),
+                    created_date=iso(created),
+                    close_date=iso(close),
+                    deal_status=derive_status(stage),
                     deal_owner=owner,
                     loss_reason=reason,
                     subscription_type=sub_type,
@@ -532,45 +630,36 @@ class DealGenerator:
         plg_to_nb_accounts: set = set()
         self._generate_self_serve_deals(deals, all_account_ids, plg_to_nb_accounts)
 
-        # Generate NB deals for PLG-to-sales accounts (if not already in selected)
+        # Generate NB deals for PLG-to-sales accounts (if not already in
+        # selected). These are always open deals in the active window, so
+        # the Phase 1 helper covers them.
+        selected_set = set(selected)
         for aid in plg_to_nb_accounts:
-            if aid in set(selected) or aid not in self.contacts_by_account:
+            if aid in selected_set or aid not in contacts_by_account:
                 continue
-            segment = self.account_segments[aid]
-            contact = self._pick_contact(aid)
-            cid = int(contact["contact_id"])
-            owner = random.choice(self.profile.sales_reps)
-            amount = self._generate_amount(primary, segment)
+            segment = account_segments[aid]
+            cid = pick_contact(aid)["contact_id"]
+            owner = choice(sales_reps)
+            amount = generate_amount(primary, segment)
             sub_type = ""
-            if self.profile.subscription_type_weights:
-                stw = self.profile.subscription_type_weights
-                sub_type = random.choices(
-                    list(stw.keys()), weights=list(stw.values()), k=1
-                )[0]
-
-            created = self._random_date(self.ACTIVE_WINDOW_START, self.DATE_RANGE_END)
-            stage = self._pick_active_stage(primary)
-            deals.append(Deal(
-                deal_id=0,
-                deal_name="",
-                account_id=aid,
-                contact_id=cid,
-                pipeline=primary,
-                segment=segment,
-                stage=stage,
-                amount=amount,
-                created_date=created.isoformat(),
-                close_date="",
-                deal_status=self._derive_status(stage),
-                deal_owner=owner,
-                loss_reason="",
-                subscription_type=sub_type,
-            ))
+            if sub_type_cdf:
+                keys, cum, total = sub_type_cdf
+                sub_type = keys[bisect.bisect(cum, rand() * total)]
+            append_open_nb(aid, cid, segment, amount, owner, sub_type)
 
         # ---- Phase 2: Renewals + Expansions ----
         r_lo_days, r_hi_days = self.profile.renewal_timing_days
         e_lo_days, e_hi_days = self.profile.expansion_timing_days
 
+        # The gap days and expansion coin flips are one-per-win and
+        # independent of the follow-up outcomes, so draw them all in one
+        # numpy batch instead of three stdlib RNG calls per win.
+        n_wins = sum(len(wins) for wins in won_nb.values())
+        r_gaps = self._rng.integers(r_lo_days, r_hi_days + 1, size=n_wins)
+        e_gaps = self._rng.integers(e_lo_days, e_hi_days + 1, size=n_wins)
+        expand = self._rng.random(n_wins) < self.profile.expansion_probability
+
+        i = 0
         for aid, wins in won_nb.items():
             segment = self.account_segments[aid]
 
@@ -579,9 +668,7 @@ class DealGenerator:
                 nb_amount = nb["amount"]
 
                 # Renewal
-                r_created = nb_close + datetime.timedelta(
-                    days=random.randint(r_lo_days, r_hi_days)
-                )
+                r_created = nb_close + datetime.timedelta(days=int(r_gaps[i]))
                 if r_created <= self.DATE_RANGE_END:
                     self._generate_followup_deal(
                         deals, aid, segment, renewal,
@@ -589,25 +676,35 @@ class DealGenerator:
                     )
 
                 # Expansion
-                if random.random() < self.profile.expansion_probability:
-                    e_created = nb_close + datetime.timedelta(
-                        days=random.randint(e_lo_days, e_hi_days)
-                    )
+                if expand[i]:
+                    e_created = nb_close + datetime.timedelta(days=int(e_gaps[i]))
                     if e_created <= self.DATE_RANGE_END:
                         self._generate_followup_deal(
                             deals, aid, segment, expansion,
                             e_created, nb_amount,
                         )
 
+                i += 1
+
         # ---- Phase 3: Sort, assign sequential IDs and names ----
-        deals.sort(key=lambda d: (d.created_date, d.account_id))
-        name_tracker: Dict[str, int] = {}
-        for idx, deal in enumerate(deals, start=1):
+        # Extract the two key columns once and let numpy's lexsort produce
+        # the permutation — cheaper than a Python tuple key per comparison.
+        if deals:
+            order = np.lexsort((
+                np.array([d.account_id for d in deals]),
+                np.array([d.created_date for d in deals]),
+            ))
+            deals = [deals[i] for i in order]
+        # Format all base names in one pass, then number duplicates with a
+        # grouped cumulative count instead of a per-row tracker dict.
+        fmt = self.profile.format_deal_name
+        account_names = self.account_names
+        bases = [fmt(account_names[d.account_id], d.created_date) for d in deals]
+        dup_counts = pd.Series(bases).groupby(bases, sort=False).cumcount()
+        for idx, (deal, base, dup) in enumerate(
+            zip(deals, bases, dup_counts), start=1
+        ):
             deal.deal_id = idx
-            company = self.account_names[deal.account_id]
-            base = self.profile.format_deal_name(company, deal.created_date)
-            count = name_tracker.get(base, 0)
-            deal.deal_name = base if count == 0 else base + chr(ord('a') + count - 1)
-            name_tracker[base] = count + 1
+            deal.deal_name = base + _DUP_SUFFIXES[dup]
 
         return deals
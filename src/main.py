@@ -15,9 +15,10 @@ the output directory.
 
 import csv
 import dataclasses
+import operator
 import os
 import sys
-from collections import Counter
+from collections import Counter, defaultdict
 
 # Add the src directory to the path so we can import our modules
 # This allows running the script from the project root directory
@@ -35,6 +36,30 @@ CONTACTS_PATH = os.path.join(PROJECT_ROOT, "output", "contacts.csv")
 DEALS_PATH = os.path.join(PROJECT_ROOT, "output", "deals.csv")
 ACTIVITIES_PATH = os.path.join(PROJECT_ROOT, "output", "activities.csv")
 
+# Console formatting
+SEPARATOR = "-" * 50
+BANNER = "=" * 50
+
+
+def _as_records(items: list) -> list:
+    """Convert dataclass instances into the dict records the loaders produce."""
+    return [dataclasses.asdict(item) for item in items]
+
+
+def _require_files(*requirements) -> bool:
+    """
+    Verify that prerequisite CSV files exist before running a flow.
+
+    Each requirement is a (path, label, hint) tuple. Prints the standard
+    missing-file message and returns False on the first missing file.
+    """
+    for path, label, hint in requirements:
+        if not os.path.exists(path):
+            print(f"\n[!] {label} not found at: {path}")
+            print(f"    {hint}")
+            return False
+    return True
+
 
 def select_business_type():
     """
@@ -122,87 +147,43 @@ def get_user_input() -> int:
             print("Invalid input. Please enter a number.")
 
 
-def save_to_csv(accounts: list, filepath: str, profile) -> None:
+def _save_records_to_csv(records: list, filepath: str, fieldnames: list) -> None:
     """
-    Save generated accounts to a CSV file.
+    Write dataclass records to a CSV file with the given column order.
 
-    Creates the output directory if it doesn't exist.
-    Writes all account fields as columns with headers.
-
-    Args:
-        accounts: List of Account dataclass instances.
-        filepath: Path where the CSV file should be saved.
-        profile: The profile instance for field names.
+    Creates the output directory if it doesn't exist. Columns are read off
+    the records with a single attrgetter and streamed through writerows.
     """
     os.makedirs(os.path.dirname(filepath), exist_ok=True)
-    fieldnames = profile.account_fields
-
-    with open(filepath, "w", newline="", encoding="utf-8") as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames, extrasaction="ignore")
-        writer.writeheader()
-        for account in accounts:
-            writer.writerow(dataclasses.asdict(account))
+    with open(filepath, "w", newline="", encoding="utf-8", buffering=1 << 20) as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(fieldnames)
+        get_row = operator.attrgetter(*fieldnames)
+        writer.writerows(map(get_row, records))
 
 
-def save_contacts_to_csv(contacts: list, filepath: str, profile) -> None:
-    """
-    Save generated contacts to a CSV file.
+def save_to_csv(accounts: list, filepath: str, profile) -> None:
+    """Save generated accounts to a CSV file."""
+    _save_records_to_csv(accounts, filepath, profile.account_fields)
 
-    Args:
-        contacts: List of Contact dataclass instances.
-        filepath: Path where the CSV file should be saved.
-        profile: The profile instance for field names.
-    """
-    os.makedirs(os.path.dirname(filepath), exist_ok=True)
-    fieldnames = profile.contact_fields
 
-    with open(filepath, "w", newline="", encoding="utf-8") as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames, extrasaction="ignore")
-        writer.writeheader()
-        for contact in contacts:
-            writer.writerow(dataclasses.asdict(contact))
+def save_contacts_to_csv(contacts: list, filepath: str, profile) -> None:
+    """Save generated contacts to a CSV file."""
+    _save_records_to_csv(contacts, filepath, profile.contact_fields)
 
 
 def save_deals_to_csv(deals: list, filepath: str, profile) -> None:
-    """
-    Save generated deals to a CSV file.
-
-    Args:
-        deals: List of Deal dataclass instances.
-        filepath: Path where the CSV file should be saved.
-        profile: The profile instance for field names.
-    """
-    os.makedirs(os.path.dirname(filepath), exist_ok=True)
-    fieldnames = profile.deal_fields
-
-    with open(filepath, "w", newline="", encoding="utf-8") as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames, extrasaction="ignore")
-        writer.writeheader()
-        for deal in deals:
-            writer.writerow(dataclasses.asdict(deal))
+    """Save generated deals to a CSV file."""
+    _save_records_to_csv(deals, filepath, profile.deal_fields)
 
 
 def save_activities_to_csv(activities: list, filepath: str, profile) -> None:
-    """
-    Save generated activities to a CSV file.
-
-    Args:
-        activities: List of Activity dataclass instances.
-        filepath: Path where the CSV file should be saved.
-        profile: The profile instance for field names.
-    """
-    os.makedirs(os.path.dirname(filepath), exist_ok=True)
-    fieldnames = profile.activity_fields
+    """Save generated activities to a CSV file."""
+    _save_records_to_csv(activities, filepath, profile.activity_fields)
 
-    with open(filepath, "w", newline="", encoding="utf-8") as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames, extrasaction="ignore")
-        writer.writeheader()
-        for activity in activities:
-            writer.writerow(dataclasses.asdict(activity))
 
-
-def generate_accounts_flow(profile) -> None:
-    """Run the accounts generation workflow."""
+def generate_accounts_flow(profile) -> list:
+    """Run the accounts generation workflow and return the accounts."""
     count = get_user_input()
 
     generator = AccountGenerator(profile=profile)
@@ -212,48 +193,64 @@ def generate_accounts_flow(profile) -> None:
 
     save_to_csv(accounts, ACCOUNTS_PATH, profile)
 
-    print("\n" + "-" * 50)
+    print("\n" + SEPARATOR)
     print("Success!")
     print(f"  Generated {count} company records")
     print(f"  Saved to: {ACCOUNTS_PATH}")
-    print("-" * 50)
+    print(SEPARATOR)
 
     # Preview first few records
     print("\nPreview of generated data:")
-    print("-" * 50)
+    print(SEPARATOR)
     for account in accounts[:3]:
         print(f"  - {account.company_name}")
         print(f"    Industry: {account.industry}")
         print(f"    Employees: {account.employee_count:,} | Revenue: ${account.annual_revenue:,}")
         print()
 
+    return accounts
 
-def generate_contacts_flow(profile) -> None:
-    """Run the contacts generation workflow."""
-    if not os.path.exists(ACCOUNTS_PATH):
-        print("\n[!] accounts.csv not found at: " + ACCOUNTS_PATH)
-        print("    Please generate accounts first (option 1) or run all (option 3).")
-        return
 
-    print(f"\nLoading accounts from: {ACCOUNTS_PATH}")
-    generator = ContactGenerator(ACCOUNTS_PATH, profile=profile)
+def generate_contacts_flow(profile, accounts: list = None) -> list:
+    """
+    Run the contacts generation workflow and return the contacts.
+
+    When `accounts` (Account instances from a prior step) is given, the
+    generator consumes them directly instead of re-parsing accounts.csv.
+    """
+    if accounts is not None:
+        generator = ContactGenerator(
+            ACCOUNTS_PATH, profile=profile, accounts=_as_records(accounts)
+        )
+    else:
+        if not _require_files(
+            (ACCOUNTS_PATH, "accounts.csv",
+             "Please generate accounts first (option 1) or run all (option 5)."),
+        ):
+            return None
+
+        print(f"\nLoading accounts from: {ACCOUNTS_PATH}")
+        generator = ContactGenerator(ACCOUNTS_PATH, profile=profile)
 
     print(f"Generating contacts for {len(generator.accounts)} accounts...")
     contacts = generator.generate()
 
     save_contacts_to_csv(contacts, CONTACTS_PATH, profile)
 
-    # Summary stats
+    # Summary stats — fill both per-contact counters in one pass.
     total = len(contacts)
-    contacts_per_account = Counter(c.account_id for c in contacts)
+    contacts_per_account = Counter()
+    owner_distribution = Counter()
+    for c in contacts:
+        contacts_per_account[c.account_id] += 1
+        owner_distribution[c.contact_owner] += 1
     count_distribution = Counter(contacts_per_account.values())
-    owner_distribution = Counter(c.contact_owner for c in contacts)
 
-    print("\n" + "-" * 50)
+    print("\n" + SEPARATOR)
     print("Success!")
     print(f"  Generated {total} contacts across {len(contacts_per_account)} accounts")
     print(f"  Saved to: {CONTACTS_PATH}")
-    print("-" * 50)
+    print(SEPARATOR)
 
     print("\nContacts per account breakdown:")
     for n in sorted(count_distribution):
@@ -266,51 +263,72 @@ def generate_contacts_flow(profile) -> None:
 
     # Preview first few records
     print("\nPreview of generated contacts:")
-    print("-" * 50)
+    print(SEPARATOR)
     for contact in contacts[:3]:
         print(f"  - {contact.first_name} {contact.last_name}")
         print(f"    {contact.title}, {contact.department}")
         print(f"    {contact.email} | Account #{contact.account_id}")
         print()
 
+    return contacts
 
-def generate_deals_flow(profile) -> None:
-    """Run the deals generation workflow."""
-    if not os.path.exists(ACCOUNTS_PATH):
-        print("\n[!] accounts.csv not found at: " + ACCOUNTS_PATH)
-        print("    Please generate accounts first (option 1) or run all (option 5).")
-        return
 
-    if not os.path.exists(CONTACTS_PATH):
-        print("\n[!] contacts.csv not found at: " + CONTACTS_PATH)
-        print("    Please generate contacts first (option 2) or run all (option 5).")
-        return
+def generate_deals_flow(profile, accounts: list = None, contacts: list = None) -> list:
+    """
+    Run the deals generation workflow and return the deals.
 
-    print(f"\nLoading accounts from: {ACCOUNTS_PATH}")
-    print(f"Loading contacts from: {CONTACTS_PATH}")
-    generator = DealGenerator(ACCOUNTS_PATH, CONTACTS_PATH, profile=profile)
+    When `accounts` and `contacts` are given (records from prior steps),
+    the generator consumes them directly instead of re-parsing the CSVs.
+    """
+    if accounts is not None and contacts is not None:
+        generator = DealGenerator(
+            ACCOUNTS_PATH, CONTACTS_PATH, profile=profile,
+            accounts=_as_records(accounts), contacts=_as_records(contacts),
+        )
+    else:
+        if not _require_files(
+            (ACCOUNTS_PATH, "accounts.csv",
+             "Please generate accounts first (option 1) or run all (option 5)."),
+            (CONTACTS_PATH, "contacts.csv",
+             "Please generate contacts first (option 2) or run all (option 5)."),
+        ):
+            return None
+
+        print(f"\nLoading accounts from: {ACCOUNTS_PATH}")
+        print(f"Loading contacts from: {CONTACTS_PATH}")
+        generator = DealGenerator(ACCOUNTS_PATH, CONTACTS_PATH, profile=profile)
 
     print(f"Generating deals for {len(generator.accounts)} accounts...")
     deals = generator.generate()
 
     save_deals_to_csv(deals, DEALS_PATH, profile)
 
-    # Summary stats
+    # Summary stats — one pass over the deals instead of a separate
+    # comprehension per pipeline/segment/status.
     total = len(deals)
-    accounts_with_deals = len(set(d.account_id for d in deals))
+    accounts_with_deals_set = set()
+    pipeline_counts = Counter()
+    segment_counts = Counter()
+    status_by_pipeline = defaultdict(Counter)
+    amount_sum_by_segment = defaultdict(int)
+    for d in deals:
+        accounts_with_deals_set.add(d.account_id)
+        pipeline_counts[d.pipeline] += 1
+        segment_counts[d.segment] += 1
+        status_by_pipeline[d.pipeline][d.deal_status] += 1
+        amount_sum_by_segment[d.segment] += d.amount
+
+    accounts_with_deals = len(accounts_with_deals_set)
     total_accounts = len(generator.accounts)
     accounts_without_deals = total_accounts - accounts_with_deals
 
-    pipeline_counts = Counter(d.pipeline for d in deals)
-    segment_counts = Counter(d.segment for d in deals)
-
-    print("\n" + "-" * 50)
+    print("\n" + SEPARATOR)
     print("Success!")
     print(f"  Generated {total} deals")
     print(f"  Accounts with deals: {accounts_with_deals}")
     print(f"  Accounts without deals: {accounts_without_deals}")
     print(f"  Saved to: {DEALS_PATH}")
-    print("-" * 50)
+    print(SEPARATOR)
 
     print("\nPipeline breakdown:")
     for pipeline_name in profile.pipelines.keys():
@@ -322,13 +340,13 @@ def generate_deals_flow(profile) -> None:
 
     print("\nOutcome rates by pipeline:")
     for pipeline_name in profile.pipelines.keys():
-        pipe_deals = [d for d in deals if d.pipeline == pipeline_name]
-        if not pipe_deals:
+        n = pipeline_counts.get(pipeline_name, 0)
+        if not n:
             continue
-        won = sum(1 for d in pipe_deals if d.deal_status == "Won")
-        lost = sum(1 for d in pipe_deals if d.deal_status == "Lost")
-        open_deals = sum(1 for d in pipe_deals if d.deal_status == "Open")
-        n = len(pipe_deals)
+        statuses = status_by_pipeline[pipeline_name]
+        won = statuses["Won"]
+        lost = statuses["Lost"]
+        open_deals = statuses["Open"]
         print(
             f"  {pipeline_name}: Won {won}/{n} ({won/n*100:.0f}%) | "
             f"Lost {lost}/{n} ({lost/n*100:.0f}%) | "
@@ -337,42 +355,59 @@ def generate_deals_flow(profile) -> None:
 
     print("\nAverage deal size by segment:")
     for segment in profile.segments:
-        seg_deals = [d for d in deals if d.segment == segment]
-        if seg_deals:
-            avg = sum(d.amount for d in seg_deals) / len(seg_deals)
+        n = segment_counts.get(segment, 0)
+        if n:
+            avg = amount_sum_by_segment[segment] / n
             print(f"  {segment}: ${avg:,.0f}")
 
     # Preview first 3 deals
     print("\nPreview of generated deals:")
-    print("-" * 50)
+    print(SEPARATOR)
     for deal in deals[:3]:
         print(f"  - {deal.deal_name}")
         print(f"    {deal.pipeline} | {deal.stage} | ${deal.amount:,}")
         print(f"    Account #{deal.account_id} | {deal.deal_status}")
         print()
 
+    return deals
 
-def generate_activities_flow(profile) -> None:
-    """Run the activities generation workflow."""
-    if not os.path.exists(ACCOUNTS_PATH):
-        print("\n[!] accounts.csv not found at: " + ACCOUNTS_PATH)
-        print("    Please generate accounts first (option 1) or run all (option 5).")
-        return
 
-    if not os.path.exists(CONTACTS_PATH):
-        print("\n[!] contacts.csv not found at: " + CONTACTS_PATH)
-        print("    Please generate contacts first (option 2) or run all (option 5).")
-        return
-
-    if not os.path.exists(DEALS_PATH):
-        print("\n[!] deals.csv not found at: " + DEALS_PATH)
-        print("    Please generate deals first (option 3) or run all (option 5).")
-        return
+def generate_activities_flow(
+    profile, accounts: list = None, contacts: list = None, deals: list = None
+) -> list:
+    """
+    Run the activities generation workflow and return the activities.
 
-    print(f"\nLoading accounts from: {ACCOUNTS_PATH}")
-    print(f"Loading contacts from: {CONTACTS_PATH}")
-    print(f"Loading deals from: {DEALS_PATH}")
-    generator = ActivityGenerator(ACCOUNTS_PATH, CONTACTS_PATH, DEALS_PATH, profile=profile)
+    When `accounts`, `contacts`, and `deals` are given (records from prior
+    steps), the generator consumes them directly instead of re-parsing the
+    CSVs.
+    """
+    if accounts is not None and contacts is not None and deals is not None:
+        deal_records = _as_records(deals)
+        # The deals loader types deal_id as int-as-string (matching
+        # Activity.deal_id); in-memory Deal ids are ints.
+        for rec in deal_records:
+            rec["deal_id"] = str(rec["deal_id"])
+        generator = ActivityGenerator(
+            ACCOUNTS_PATH, CONTACTS_PATH, DEALS_PATH, profile=profile,
+            accounts=_as_records(accounts), contacts=_as_records(contacts),
+            deals=deal_records,
+        )
+    else:
+        if not _require_files(
+            (ACCOUNTS_PATH, "accounts.csv",
+             "Please generate accounts first (option 1) or run all (option 5)."),
+            (CONTACTS_PATH, "contacts.csv",
+             "Please generate contacts first (option 2) or run all (option 5)."),
+            (DEALS_PATH, "deals.csv",
+             "Please generate deals first (option 3) or run all (option 5)."),
+        ):
+            return None
+
+        print(f"\nLoading accounts from: {ACCOUNTS_PATH}")
+        print(f"Loading contacts from: {CONTACTS_PATH}")
+        print(f"Loading deals from: {DEALS_PATH}")
+        generator = ActivityGenerator(ACCOUNTS_PATH, CONTACTS_PATH, DEALS_PATH, profile=profile)
 
     total_deals = len(generator.deals)
     total_accounts = len(generator.accounts)
@@ -382,54 +417,54 @@ def generate_activities_flow(profile) -> None:
     save_activities_to_csv(activities, ACTIVITIES_PATH, profile)
 
     # --- Summary stats ---
+    # Deal metadata lookups built by the generator while indexing deals
+    deal_status_map = generator.deal_status_map
+    deal_segment_map = generator.deal_segment_map
+
+    # One pass over the activities covers the type/segment breakdowns,
+    # the deal-linked split, and the per-deal grouping.
     total = len(activities)
-    type_counts = Counter(a.activity_type for a in activities)
-
-    # Separate deal-linked vs non-deal
-    deal_linked = [a for a in activities if a.deal_id]
-    non_deal = [a for a in activities if not a.deal_id]
-
-    # Build deal metadata lookups
-    deal_status_map = {d["deal_id"]: d["deal_status"] for d in generator.deals}
-    deal_segment_map = {d["deal_id"]: d["segment"] for d in generator.deals}
-
-    # Group deal-linked activities by deal to compute averages
-    activities_per_deal = Counter(a.deal_id for a in deal_linked)
-
-    won_counts = [
-        c for did, c in activities_per_deal.items()
-        if deal_status_map.get(did) == "Won"
-    ]
-    lost_counts = [
-        c for did, c in activities_per_deal.items()
-        if deal_status_map.get(did) == "Lost"
-    ]
-    active_counts = [
-        c for did, c in activities_per_deal.items()
-        if deal_status_map.get(did) == "Open"
-    ]
-
-    avg_won = sum(won_counts) / len(won_counts) if won_counts else 0
-    avg_lost = sum(lost_counts) / len(lost_counts) if lost_counts else 0
-    avg_active = sum(active_counts) / len(active_counts) if active_counts else 0
-
-    # Per-segment breakdown of deal-linked activities
+    type_counts = Counter()
+    activities_per_deal = Counter()
     segment_activity_counts = Counter()
-    for a in deal_linked:
-        seg = deal_segment_map.get(a.deal_id, "Unknown")
-        segment_activity_counts[seg] += 1
+    accounts_with_activities = set()
+    deal_linked_count = 0
+    for a in activities:
+        type_counts[a.activity_type] += 1
+        accounts_with_activities.add(a.account_id)
+        did = a.deal_id
+        if did:
+            deal_linked_count += 1
+            activities_per_deal[did] += 1
+            segment_activity_counts[deal_segment_map.get(did, "Unknown")] += 1
+    non_deal_count = total - deal_linked_count
+
+    # Average activities per deal by outcome: (deal count, activity count)
+    outcome_totals = {"Won": [0, 0], "Lost": [0, 0], "Open": [0, 0]}
+    for did, cnt in activities_per_deal.items():
+        totals = outcome_totals.get(deal_status_map.get(did))
+        if totals is not None:
+            totals[0] += 1
+            totals[1] += cnt
+
+    won_deals, won_acts = outcome_totals["Won"]
+    lost_deals, lost_acts = outcome_totals["Lost"]
+    active_deals, active_acts = outcome_totals["Open"]
+    avg_won = won_acts / won_deals if won_deals else 0
+    avg_lost = lost_acts / lost_deals if lost_deals else 0
+    avg_active = active_acts / active_deals if active_deals else 0
 
     # Accounts with zero activities
-    accounts_with_activities = set(a.account_id for a in activities)
-    all_account_ids = set(int(a["id"]) for a in generator.accounts)
-    zero_activity_accounts = all_account_ids - accounts_with_activities
+    zero_activity_accounts = (
+        set(generator.all_account_ids) - accounts_with_activities
+    )
 
-    print("\n" + "-" * 50)
+    print("\n" + SEPARATOR)
     print("Success!")
     print(f"  Generated {total} activities")
-    print(f"  Deal-linked: {len(deal_linked)} | Non-deal: {len(non_deal)}")
+    print(f"  Deal-linked: {deal_linked_count} | Non-deal: {non_deal_count}")
     print(f"  Saved to: {ACTIVITIES_PATH}")
-    print("-" * 50)
+    print(SEPARATOR)
 
     print("\nActivity type breakdown:")
     for atype in profile.activity_types:
@@ -438,9 +473,9 @@ def generate_activities_flow(profile) -> None:
         print(f"  {atype}: {cnt} ({pct:.0f}%)")
 
     print("\nAvg activities per deal by outcome:")
-    print(f"  Won deals:    {avg_won:.1f} avg ({len(won_counts)} deals)")
-    print(f"  Lost deals:   {avg_lost:.1f} avg ({len(lost_counts)} deals)")
-    print(f"  Open deals:   {avg_active:.1f} avg ({len(active_counts)} deals)")
+    print(f"  Won deals:    {avg_won:.1f} avg ({won_deals} deals)")
+    print(f"  Lost deals:   {avg_lost:.1f} avg ({lost_deals} deals)")
+    print(f"  Open deals:   {avg_active:.1f} avg ({active_deals} deals)")
 
     print("\nDeal-linked activities by segment:")
     for seg in profile.segments:
@@ -450,7 +485,7 @@ def generate_activities_flow(profile) -> None:
 
     # Preview first 3 activities
     print("\nPreview of generated activities:")
-    print("-" * 50)
+    print(SEPARATOR)
     for activity in activities[:3]:
         deal_info = f"Deal #{activity.deal_id}" if activity.deal_id else "No deal"
         print(f"  - [{activity.activity_type}] {activity.subject}")
@@ -458,29 +493,35 @@ def generate_activities_flow(profile) -> None:
         print(f"    Owner: {activity.activity_owner} | Completed: {activity.completed}")
         print()
 
+    return activities
+
 
 def generate_all_flow(profile) -> None:
-    """Run accounts, contacts, deals, then activities generation sequentially."""
-    generate_accounts_flow(profile)
-    generate_contacts_flow(profile)
-    generate_deals_flow(profile)
-    generate_activities_flow(profile)
+    """
+    Run accounts, contacts, deals, then activities generation sequentially,
+    handing each stage's in-memory records to the next so nothing is
+    re-parsed from disk.
+    """
+    accounts = generate_accounts_flow(profile)
+    contacts = generate_contacts_flow(profile, accounts=accounts)
+    deals = generate_deals_flow(profile, accounts=accounts, contacts=contacts)
+    generate_activities_flow(
+        profile, accounts=accounts, contacts=contacts, deals=deals
+    )
 
 
 def generate_crm_export_flow(profile) -> None:
     """Run the CRM export workflow using existing generated CSVs."""
     import pandas as pd
 
-    for path, label in [
-        (ACCOUNTS_PATH, "accounts.csv"),
-        (CONTACTS_PATH, "contacts.csv"),
-        (DEALS_PATH, "deals.csv"),
-        (ACTIVITIES_PATH, "activities.csv"),
-    ]:
-        if not os.path.exists(path):
-            print(f"\n[!] {label} not found at: {path}")
-            print("    Please generate all data first (option 5).")
-            return
+    hint = "Please generate all data first (option 5)."
+    if not _require_files(
+        (ACCOUNTS_PATH, "accounts.csv", hint),
+        (CONTACTS_PATH, "contacts.csv", hint),
+        (DEALS_PATH, "deals.csv", hint),
+        (ACTIVITIES_PATH, "activities.csv", hint),
+    ):
+        return
 
     print("\nWhich CRM format?")
     print("  1) HubSpot")
@@ -521,11 +562,11 @@ def generate_crm_export_flow(profile) -> None:
             with open(filepath, "w", encoding="utf-8") as f:
                 f.write(content)
 
-    print("\n" + "-" * 50)
+    print("\n" + SEPARATOR)
     print("Success!")
     print(f"  Exported {len(files)} files for {crm_name}")
     print(f"  Saved to: {output_dir}/")
-    print("-" * 50)
+    print(SEPARATOR)
 
     print("\nGenerated files:")
     for filename in sorted(files.keys()):
@@ -540,10 +581,10 @@ def main():
     generation workflow.
     """
     # Display welcome banner
-    print("\n" + "=" * 50)
+    print("\n" + BANNER)
     print("  CRM Dataset Builder")
     print("  Generate realistic CRM company data")
-    print("=" * 50)
+    print(BANNER)
 
     profile = select_business_type()
 
@@ -249,12 +249,9 @@ class B2BSaaSProfile(BaseProfile):
     def segments(self) -> List[str]:
         return ["SMB", "Mid-Market", "Enterprise", "Self-Serve"]
 
-    def classify_segment(self, employee_count: int) -> str:
-        if employee_count < 200:
-            return "SMB"
-        elif employee_count <= 1000:
-            return "Mid-Market"
-        return "Enterprise"
+    @property
+    def segment_thresholds(self) -> Tuple[int, int]:
+        return (200, 1000)
 
     @property
     def acv_ranges(self) -> Dict[str, Tuple[int, int]]:
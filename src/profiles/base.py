@@ -144,9 +144,19 @@ class BaseProfile(ABC):
     def segments(self) -> List[str]:
         """Ordered list of segment names."""
 
+    @property
     @abstractmethod
+    def segment_thresholds(self) -> Tuple[int, int]:
+        """(smb_max, midmarket_max) employee-count boundaries for segments."""
+
     def classify_segment(self, employee_count: int) -> str:
         """Classify an account into a segment based on employee count."""
+        smb_max, mid_max = self.segment_thresholds
+        if employee_count < smb_max:
+            return "SMB"
+        elif employee_count <= mid_max:
+            return "Mid-Market"
+        return "Enterprise"
 
     @property
     @abstractmethod
@@ -228,12 +228,9 @@ class ManufacturerProfile(BaseProfile):
     def segments(self) -> List[str]:
         return ["SMB", "Mid-Market", "Enterprise"]
 
-    def classify_segment(self, employee_count: int) -> str:
-        if employee_count < 100:
-            return "SMB"
-        elif employee_count <= 500:
-            return "Mid-Market"
-        return "Enterprise"
+    @property
+    def segment_thresholds(self) -> Tuple[int, int]:
+        return (100, 500)
 
     @property
     def acv_ranges(self) -> Dict[str, Tuple[int, int]]: